@@ -4,159 +4,177 @@ Generate a minimal valid UGE v6 file for testing.
 Creates a file with 15 duty, 15 wave, 15 noise instruments (all minimal/empty),
 followed by minimal wavetable, patterns, orders, and routines.
 """
+import functools
+import os
 import struct
 
-def write_u8(f, val):
-    f.write(struct.pack('<B', val))
+# One 64-row cell block: note, instrument, volume, effect_code (u32 each) + effect_param (u8).
+# Every row is empty: note = 90 (unused), volume = 0x00005A00 (23040) - "no volume change" marker.
+_ROW = struct.Struct('<IIIIB')
+_EMPTY_SUBPATTERN = _ROW.pack(90, 0, 0x00005A00, 0, 0) * 64
 
-def write_u32(f, val):
-    f.write(struct.pack('<I', val))
+_U8 = struct.Struct('<B').pack
+_U32 = struct.Struct('<I').pack
 
-def write_bool(f, val):
-    write_u8(f, 1 if val else 0)
+def _pack_shortstring(s):
+    """Pack shortstring: 1 byte length + 255 bytes (padded with zeros)"""
+    b = s.encode('utf-8')[:255]
+    return bytes([len(b)]) + b + b'\x00' * (255 - len(b))
+
+def write_u8(buf, val):
+    buf.extend(_U8(val))
+
+def write_u32(buf, val):
+    buf.extend(_U32(val))
 
-def write_shortstring(f, s):
+def write_bool(buf, val):
+    write_u8(buf, 1 if val else 0)
+
+def write_shortstring(buf, s):
     """Write shortstring: 1 byte length + 255 bytes (padded with zeros)"""
-    b = s.encode('utf-8')[:255]
-    write_u8(f, len(b))
-    f.write(b + b'\x00' * (255 - len(b)))
+    buf.extend(_pack_shortstring(s))
 
-def write_string(f, s):
+def write_string(buf, s):
     """Write string: u32 length + bytes (Pascal AnsiString format - length does NOT include null terminator)"""
     b = s.encode('utf-8')
-    write_u32(f, len(b))
+    write_u32(buf, len(b))
     if len(b) > 0:
-        f.write(b)
-
-def write_minimal_duty_instrument(f, idx):
-    write_u32(f, 0)  # type = duty
-    write_shortstring(f, f"duty{idx}")
-    write_u32(f, 0)  # length
-    write_bool(f, False)  # length_enabled
-    write_u8(f, 15)  # initial_volume
-    write_u32(f, 0)  # volume_sweep_dir
-    write_u8(f, 0)  # volume_sweep_change
-    write_u32(f, 0)  # freq_sweep_time
-    write_u32(f, 0)  # sweep_enabled
-    write_u32(f, 0)  # freq_sweep_shift
-    write_u8(f, 2)  # duty_cycle (50%)
-    write_u32(f, 0)  # unused_a
-    write_u32(f, 0)  # unused_b
-    write_u32(f, 0)  # counter_step (TStepWidth)
-    # v6: subpattern_enabled + subpattern (ALWAYS 64 rows in TInstrumentV3)
-    write_bool(f, False)
-    # Write 64 subpattern rows (part of TInstrumentV3 structure)
-    for row in range(64):
-        write_u32(f, 90)  # note
-        write_u32(f, 0)   # instrument  
-        write_u32(f, 0x00005A00)  # volume
-        write_u32(f, 0)   # effect_code
-        write_u8(f, 0)    # effect_param
-
-def write_minimal_wave_instrument(f, idx):
-    write_u32(f, 1)  # type = wave
-    write_shortstring(f, f"wave{idx}")
-    write_u32(f, 0)  # length
-    write_bool(f, False)  # length_enabled
-    write_u8(f, 0)  # unused1
-    write_u32(f, 0)  # unused2
-    write_u8(f, 0)  # unused3
-    write_u32(f, 0)  # unused4
-    write_u32(f, 0)  # unused5
-    write_u32(f, 0)  # unused6
-    write_u8(f, 0)  # unused7
-    write_u32(f, 3)  # volume
-    write_u32(f, 0)  # wave_index
-    write_u32(f, 0)  # counter_step (TStepWidth)
-    # v6: subpattern_enabled + subpattern (ALWAYS 64 rows in TInstrumentV3)
-    write_bool(f, False)
-    # Write 64 subpattern rows (part of TInstrumentV3 structure)
-    for row in range(64):
-        write_u32(f, 90)  # note
-        write_u32(f, 0)   # instrument
-        write_u32(f, 0x00005A00)  # volume
-        write_u32(f, 0)   # effect_code
-        write_u8(f, 0)    # effect_param
-
-def write_minimal_noise_instrument(f, idx):
-    write_u32(f, 2)  # type = noise
-    write_shortstring(f, f"noise{idx}")
-    write_u32(f, 0)  # length
-    write_bool(f, False)  # length_enabled
-    write_u8(f, 15)  # initial_volume
-    write_u32(f, 1)  # volume_sweep_dir
-    write_u8(f, 0)  # volume_sweep_change
-    write_u32(f, 0)  # unused_a
-    write_u32(f, 0)  # unused_b
-    write_u32(f, 0)  # unused_c
-    write_u8(f, 0)  # unused_d
-    write_u32(f, 0)  # unused_e
-    write_u32(f, 0)  # unused_f
-    write_u32(f, 0)  # counter_step (TStepWidth)
-    # v6: subpattern_enabled + subpattern (ALWAYS 64 rows in TInstrumentV3)
-    write_bool(f, False)
-    # Write 64 subpattern rows (part of TInstrumentV3 structure)
-    for row in range(64):
-        write_u32(f, 90)  # note
-        write_u32(f, 0)   # instrument
-        write_u32(f, 0x00005A00)  # volume
-        write_u32(f, 0)   # effect_code
-        write_u8(f, 0)    # effect_param
+        buf.extend(b)
+
+# Every minimal instrument is identical apart from its name, so the type word,
+# the 15 names and everything after the name are packed once at import time.
+# All three kinds share the TInstrumentV3 field layout after the name:
+# u32, bool, u8, u32, u8, u32, u32, u32, u8, u32, u32, u32 counter_step, bool subpattern_enabled
+_INSTRUMENT_TAIL = struct.Struct('<IBBIBIIIBIIIB')
+
+_DUTY_TYPE = _U32(0)  # type = duty
+_DUTY_NAMES = [_pack_shortstring(f"duty{i}") for i in range(15)]
+_DUTY_TAIL = _INSTRUMENT_TAIL.pack(
+    0,   # length
+    0,   # length_enabled
+    15,  # initial_volume
+    0,   # volume_sweep_dir
+    0,   # volume_sweep_change
+    0,   # freq_sweep_time
+    0,   # sweep_enabled
+    0,   # freq_sweep_shift
+    2,   # duty_cycle (50%)
+    0,   # unused_a
+    0,   # unused_b
+    0,   # counter_step (TStepWidth)
+    0,   # v6: subpattern_enabled
+) + _EMPTY_SUBPATTERN  # subpattern (ALWAYS 64 rows in TInstrumentV3)
+
+_WAVE_TYPE = _U32(1)  # type = wave
+_WAVE_NAMES = [_pack_shortstring(f"wave{i}") for i in range(15)]
+_WAVE_TAIL = _INSTRUMENT_TAIL.pack(
+    0,   # length
+    0,   # length_enabled
+    0,   # unused1
+    0,   # unused2
+    0,   # unused3
+    0,   # unused4
+    0,   # unused5
+    0,   # unused6
+    0,   # unused7
+    3,   # volume
+    0,   # wave_index
+    0,   # counter_step (TStepWidth)
+    0,   # v6: subpattern_enabled
+) + _EMPTY_SUBPATTERN  # subpattern (ALWAYS 64 rows in TInstrumentV3)
+
+_NOISE_TYPE = _U32(2)  # type = noise
+_NOISE_NAMES = [_pack_shortstring(f"noise{i}") for i in range(15)]
+_NOISE_TAIL = _INSTRUMENT_TAIL.pack(
+    0,   # length
+    0,   # length_enabled
+    15,  # initial_volume
+    1,   # volume_sweep_dir
+    0,   # volume_sweep_change
+    0,   # unused_a
+    0,   # unused_b
+    0,   # unused_c
+    0,   # unused_d
+    0,   # unused_e
+    0,   # unused_f
+    0,   # counter_step (TStepWidth)
+    0,   # v6: subpattern_enabled
+) + _EMPTY_SUBPATTERN  # subpattern (ALWAYS 64 rows in TInstrumentV3)
+
+# Wavetable: 16 identical waves × 32 nibbles, each a simple 0..15 ramp played twice
+_WAVETABLE = bytes(range(16)) * 2 * 16
+
+def write_minimal_duty_instrument(buf, idx):
+    buf.extend(_DUTY_TYPE)
+    buf.extend(_DUTY_NAMES[idx])
+    buf.extend(_DUTY_TAIL)
+
+def write_minimal_wave_instrument(buf, idx):
+    buf.extend(_WAVE_TYPE)
+    buf.extend(_WAVE_NAMES[idx])
+    buf.extend(_WAVE_TAIL)
+
+def write_minimal_noise_instrument(buf, idx):
+    buf.extend(_NOISE_TYPE)
+    buf.extend(_NOISE_NAMES[idx])
+    buf.extend(_NOISE_TAIL)
+
+@functools.cache
+def _build_uge_v6_bytes():
+    """Assemble the complete file. The content is fixed, so it is built only once."""
+    buf = bytearray()
+
+    # Header
+    write_u32(buf, 6)  # version = 6
+    write_shortstring(buf, "Test Song")
+    write_shortstring(buf, "Test Artist")
+    write_shortstring(buf, "Generated minimal UGE v6")
+
+    # 15 duty instruments
+    for i in range(15):
+        write_minimal_duty_instrument(buf, i)
+
+    # 15 wave instruments
+    for i in range(15):
+        write_minimal_wave_instrument(buf, i)
+
+    # 15 noise instruments
+    for i in range(15):
+        write_minimal_noise_instrument(buf, i)
+
+    # Wavetable: 16 waves × 32 nibbles
+    buf.extend(_WAVETABLE)
+
+    # Patterns section
+    write_u32(buf, 7)  # initial_ticks_per_row (7 is common default, ~120 BPM)
+    write_bool(buf, False)  # timer_tempo_enabled
+    write_u32(buf, 0)  # timer_tempo_divider
+    write_u32(buf, 1)  # num_patterns (1 empty pattern)
+
+    # Pattern 0
+    write_u32(buf, 0)  # pattern index
+    buf.extend(_EMPTY_SUBPATTERN)
+
+    # Orders: 4 channels, each with 1 pattern
+    # Pascal code: Read n, allocate n elements, read n integers
+    # For 1 order: write length=1, then write 1 integer (the pattern index)
+    for ch in range(4):
+        write_u32(buf, 1)  # order_length = 1 (one pattern in the order)
+        write_u32(buf, 0)  # index[0] = pattern 0
+
+    # Routines: 16 empty strings
+    for i in range(16):
+        write_string(buf, "")
+
+    return bytes(buf)
 
 def generate_minimal_uge_v6(output_path):
+    data = _build_uge_v6_bytes()
     with open(output_path, 'wb') as f:
-        # Header
-        write_u32(f, 6)  # version = 6
-        write_shortstring(f, "Test Song")
-        write_shortstring(f, "Test Artist")
-        write_shortstring(f, "Generated minimal UGE v6")
-
-        # 15 duty instruments
-        for i in range(15):
-            write_minimal_duty_instrument(f, i)
-
-        # 15 wave instruments
-        for i in range(15):
-            write_minimal_wave_instrument(f, i)
-
-        # 15 noise instruments
-        for i in range(15):
-            write_minimal_noise_instrument(f, i)
-
-        # Wavetable: 16 waves × 32 nibbles
-        for w in range(16):
-            for n in range(32):
-                # Simple sine-ish wave pattern
-                write_u8(f, (n % 16))
-
-        # Patterns section
-        write_u32(f, 7)  # initial_ticks_per_row (7 is common default, ~120 BPM)
-        write_bool(f, False)  # timer_tempo_enabled
-        write_u32(f, 0)  # timer_tempo_divider
-        write_u32(f, 1)  # num_patterns (1 empty pattern)
-
-        # Pattern 0
-        write_u32(f, 0)  # pattern index
-        for row in range(64):
-            write_u32(f, 90)  # note = 90 (unused)
-            write_u32(f, 0)  # instrument_value
-            write_u32(f, 0x00005A00)  # volume = 0x00005A00 (23040) - "no volume change" marker
-            write_u32(f, 0)  # effect_code
-            write_u8(f, 0)  # effect_param
-
-        # Orders: 4 channels, each with 1 pattern
-        # Pascal code: Read n, allocate n elements, read n integers
-        # For 1 order: write length=1, then write 1 integer (the pattern index)
-        for ch in range(4):
-            write_u32(f, 1)  # order_length = 1 (one pattern in the order)
-            write_u32(f, 0)  # index[0] = pattern 0
-
-        # Routines: 16 empty strings
-        for i in range(16):
-            write_string(f, "")
+        f.write(data)
 
     print(f"[OK] Generated minimal valid UGE v6 file: {output_path}")
-    print(f"  File size: {open(output_path, 'rb').seek(0, 2)} bytes" if open(output_path, 'rb') else "")
+    print(f"  File size: {os.path.getsize(output_path)} bytes")
 
 if __name__ == '__main__':
     generate_minimal_uge_v6('valid_v6_test.uge')
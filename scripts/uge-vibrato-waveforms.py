@@ -1,30 +1,37 @@
-import matplotlib.pyplot as plt
 import numpy as np
-from io import BytesIO
+from reportlab.graphics.shapes import Drawing, PolyLine
 from reportlab.lib.pagesizes import letter
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Image, Paragraph, Spacer
+from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
 from reportlab.lib import colors
-from reportlab.lib.styles import getSampleStyleSheet
+from reportlab.lib.enums import TA_CENTER
+from reportlab.lib.styles import ParagraphStyle
 
-# --- Waveform definitions as normalized arrays (one cycle, 32 points) ---
-waveforms = {
-    "0": np.zeros(32),  # Off
-    "1": np.tile([1, -1], 16),  # Square
-    "2": np.concatenate([np.linspace(-1, 1, 16), np.linspace(1, -1, 16)]),  # Triangle
-    "3": np.concatenate([np.linspace(-1, 1, 31), [-1]]),  # Saw Up
-    "4": np.concatenate([np.linspace(1, -1, 31), [1]]),   # Saw Down
-    "5": np.array([1, -1, 1, -1] + [0]*28),  # Step / Stepped (short steps)
-    "6": np.array([1]*4 + [-1]*4 + [0]*24),  # Long Step / Gated
-    "7": np.array([1]*5 + [-1]*5 + [0]*22), # Extra Long Step / Gated Slow
-    "8": np.array([1]*8 + [-1]*8 + [0]*16), # Ultra Long Step / Pulsed Extreme
-    "9": np.array([1, -1, 1, -1, 0, 0, 0, 0]*4), # Hybrid / Trill Step
-    "A": np.concatenate([np.linspace(-1, 1, 8), np.zeros(16), np.linspace(-1, 1, 8)]), # Hybrid Triangle Step
-    "B": np.concatenate([np.linspace(-1, 1, 5), np.zeros(16), np.linspace(-1, 1, 11)]), # Hybrid Saw Up Step
-    "C": np.concatenate([np.zeros(4), np.zeros(12), np.linspace(1, -1, 8), np.zeros(8)]), # Long Step Saw Down
-    "D": np.array([1, -1, 0, 0]*8),  # Hybrid Step Long Pause
-    "E": np.concatenate([np.zeros(2), np.zeros(14), np.zeros(2), np.linspace(-1,0,8)]), # Ultra Long Step / Slow Pulse
-    "F": np.concatenate([np.zeros(1), np.zeros(15), np.zeros(1), np.linspace(-1,0,8)]), # Extreme Long Step / Subtle Pulse
-}
+# --- Waveform definitions: one normalized cycle (32 points) per row, indexed by hex digit ---
+wavetable = np.zeros((16, 32), dtype=np.float32)
+# 0x0: Off (all zeros)
+wavetable[0x1] = np.tile([1, -1], 16)  # Square
+wavetable[0x2, :16] = np.linspace(-1, 1, 16)  # Triangle
+wavetable[0x2, 16:] = np.linspace(1, -1, 16)
+wavetable[0x3, :31] = np.linspace(-1, 1, 31)  # Saw Up
+wavetable[0x3, 31] = -1
+wavetable[0x4, :31] = np.linspace(1, -1, 31)  # Saw Down
+wavetable[0x4, 31] = 1
+wavetable[0x5, :4] = [1, -1, 1, -1]  # Step / Stepped (short steps)
+wavetable[0x6, :4] = 1  # Long Step / Gated
+wavetable[0x6, 4:8] = -1
+wavetable[0x7, :5] = 1  # Extra Long Step / Gated Slow
+wavetable[0x7, 5:10] = -1
+wavetable[0x8, :8] = 1  # Ultra Long Step / Pulsed Extreme
+wavetable[0x8, 8:16] = -1
+wavetable[0x9] = np.tile([1, -1, 1, -1, 0, 0, 0, 0], 4)  # Hybrid / Trill Step
+wavetable[0xA, :8] = np.linspace(-1, 1, 8)  # Hybrid Triangle Step
+wavetable[0xA, 24:] = np.linspace(-1, 1, 8)
+wavetable[0xB, :5] = np.linspace(-1, 1, 5)  # Hybrid Saw Up Step
+wavetable[0xB, 21:] = np.linspace(-1, 1, 11)
+wavetable[0xC, 16:24] = np.linspace(1, -1, 8)  # Long Step Saw Down
+wavetable[0xD] = np.tile([1, -1, 0, 0], 8)  # Hybrid Step Long Pause
+wavetable[0xE, 18:26] = np.linspace(-1, 0, 8)  # Ultra Long Step / Slow Pulse
+wavetable[0xF, 17:25] = np.linspace(-1, 0, 8)  # Extreme Long Step / Subtle Pulse
 
 # Suggested names
 names = {
@@ -66,36 +73,37 @@ usage = {
     "F": "Very slow, almost imperceptible modulation, tiny step",
 }
 
-# Function to plot waveform and return a PIL image
-def waveform_to_image(wave_data):
-    fig, ax = plt.subplots(figsize=(2, 0.5))
-    ax.plot(wave_data, color="black", linewidth=1)
-    ax.axis('off')
-    ax.set_xlim(0, len(wave_data)-1)
-    ax.set_ylim(-1.2, 1.2)
-    buf = BytesIO()
-    plt.savefig(buf, format='png', bbox_inches='tight', dpi=150)
-    plt.close(fig)
-    buf.seek(0)
-    return buf
+# Waveforms are drawn as vector polylines filling a 100x25 pt table cell
+CELL_W, CELL_H = 100, 25
+
+# Point coordinates for all waveforms at once: x is shared by every row, y is one
+# vectorized map of the whole table (PDF y grows upwards; keep -1.2..1.2 headroom)
+x_pt = np.linspace(0, CELL_W, wavetable.shape[1]).tolist()
+y_mid = CELL_H / 2
+y_pt = y_mid + wavetable * (y_mid / 1.2)
+
+# Function to build a vector drawing from one row of waveform y-coordinates
+def waveform_to_drawing(y_row):
+    d = Drawing(CELL_W, CELL_H)
+    d.add(PolyLine(list(zip(x_pt, y_row.tolist())), strokeColor=colors.black, strokeWidth=1))
+    return d
 
 # Create PDF
 pdf_file = "hUGETracker_Vibrato_Waveforms.pdf"
 doc = SimpleDocTemplate(pdf_file, pagesize=letter)
-styles = getSampleStyleSheet()
 elements = []
 
-# Title
-elements.append(Paragraph("hUGETracker Vibrato Waveform Reference", styles['Title']))
+# Title (same look as the sample stylesheet's 'Title', without building the whole sheet)
+title_style = ParagraphStyle('Title', fontName='Helvetica-Bold', fontSize=18, leading=22,
+                             alignment=TA_CENTER, spaceAfter=6)
+elements.append(Paragraph("hUGETracker Vibrato Waveform Reference", title_style))
 elements.append(Spacer(1, 12))
 
 # Table data
 table_data = [["# / Hex", "Suggested Name", "Waveform", "Recommended Usage"]]
 
-for key in sorted(waveforms.keys()):
-    img_buf = waveform_to_image(waveforms[key])
-    img = Image(img_buf, width=100, height=25)
-    table_data.append([key, names[key], img, usage[key]])
+for key in sorted(names.keys()):
+    table_data.append([key, names[key], waveform_to_drawing(y_pt[int(key, 16)]), usage[key]])
 
 # Create table
 table = Table(table_data, colWidths=[40, 120, 120, 200])
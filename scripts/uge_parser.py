@@ -4,7 +4,13 @@
 UGE Parser (verbose) – reads hUGETracker .uge files (v5/v6), prints all details.
 
 Usage:
-  python uge_parser_verbose.py path/to/song.uge
+  python uge_parser_verbose.py [-v|--verbose] [-q|--quiet] path/to/song.uge
+
+  -v, --verbose   also print per-instrument parse diagnostics (offsets, sweep fields)
+  -q, --quiet     parse and validate only; skip the full dump
+
+Library use: `read_uge(path)` returns the parsed UgeSong without printing;
+`dump_song(song)` is the CLI pretty-printer.
 
 Spec reference: https://superdisk.github.io/hUGETracker/hUGETracker/uge-format.html
 
@@ -22,104 +28,168 @@ Notes:
 - For v>=6, extra fields (e.g., subpattern_enabled, pattern unused u32, timer tempo) are present.
 """
 
+import argparse
+import functools
+import operator
 import sys
 import struct
+from array import array
 from dataclasses import dataclass
-from typing import List, Optional, BinaryIO, Tuple
-
-# -------------------- Safe read helpers --------------------
-
-def read_exact(f: BinaryIO, n: int, ctx: str) -> bytes:
-    pos = f.tell()
-    b = f.read(n)
-    if len(b) != n:
-        raise EOFError(f"Needed {n} bytes for {ctx} at offset {pos}, got {len(b)}")
-    return b
+from typing import Callable, ClassVar, List, Optional, Tuple, Union
 
-def read_u8(f: BinaryIO, ctx: str = "u8") -> int:
-    return struct.unpack('<B', read_exact(f, 1, ctx))[0]
+# Print per-instrument parse diagnostics (set by --verbose)
+VERBOSE = False
 
-def read_u32(f: BinaryIO, ctx: str = "u32") -> int:
-    return struct.unpack('<I', read_exact(f, 4, ctx))[0]
-
-def read_i8(f: BinaryIO, ctx: str = "i8") -> int:
-    return struct.unpack('<b', read_exact(f, 1, ctx))[0]
-
-def read_bool_u8(f: BinaryIO, ctx: str = "bool(u8)") -> bool:
-    return read_u8(f, ctx) != 0
+# -------------------- Safe read helpers --------------------
 
-def read_shortstring(f: BinaryIO, ctx: str = "shortstring") -> str:
-    L = read_u8(f, ctx + ".length")
-    raw = read_exact(f, 255, ctx + ".payload[255]")
-    return raw[:L].decode('utf-8', errors='replace')
+# Precompiled little-endian field formats (avoid re-parsing format strings per read)
+_U8 = struct.Struct('<B')
+_U32 = struct.Struct('<I')
+_I8 = struct.Struct('<b')
+
+class Cursor:
+    """Read position over an in-memory copy of the whole .uge file."""
+
+    __slots__ = ('buf', 'off')
+
+    def __init__(self, data: bytes):
+        self.buf = memoryview(data)
+        self.off = 0
+
+def _require(cur: Cursor, n: int, ctx: str) -> None:
+    avail = len(cur.buf) - cur.off
+    if avail < n:
+        raise EOFError(f"Needed {n} bytes for {ctx} at offset {cur.off}, got {max(avail, 0)}")
+
+def read_exact(cur: Cursor, n: int, ctx: str) -> memoryview:
+    _require(cur, n, ctx)
+    pos = cur.off
+    cur.off = pos + n
+    return cur.buf[pos:pos + n]
+
+def skip(cur: Cursor, n: int, ctx: str) -> None:
+    _require(cur, n, ctx)
+    cur.off += n
+
+def read_u8(cur: Cursor, ctx: str = "u8") -> int:
+    _require(cur, 1, ctx)
+    v = _U8.unpack_from(cur.buf, cur.off)[0]
+    cur.off += 1
+    return v
+
+def read_u32(cur: Cursor, ctx: str = "u32") -> int:
+    _require(cur, 4, ctx)
+    v = _U32.unpack_from(cur.buf, cur.off)[0]
+    cur.off += 4
+    return v
+
+def read_i8(cur: Cursor, ctx: str = "i8") -> int:
+    _require(cur, 1, ctx)
+    v = _I8.unpack_from(cur.buf, cur.off)[0]
+    cur.off += 1
+    return v
+
+def read_bool_u8(cur: Cursor, ctx: str = "bool(u8)") -> bool:
+    return read_u8(cur, ctx) != 0
+
+def decode_shortstring(L: int, raw) -> str:
+    # Decode only the first L bytes straight from the buffer; most names are empty
+    return str(raw[:L], 'utf-8', 'replace') if L else ''
+
+def read_shortstring(cur: Cursor, ctx: str = "shortstring") -> str:
+    L = read_u8(cur, ctx + ".length")
+    raw = read_exact(cur, 255, ctx + ".payload[255]")
+    return decode_shortstring(L, raw)
 
 # string: u32 character count, then that many bytes (0x00 may appear; we strip trailing nulls)
 
-def read_string(f: BinaryIO, ctx: str = "string") -> str:
-    n_chars = read_u32(f, ctx + ".len")
-    data = read_exact(f, n_chars, ctx + ".data")
-    return data.rstrip(b" ").decode('utf-8', errors='replace')
+def read_string(cur: Cursor, ctx: str = "string") -> str:
+    n_chars = read_u32(cur, ctx + ".len")
+    if n_chars == 0:
+        return ''
+    data = read_exact(cur, n_chars, ctx + ".data")
+    return bytes(data).rstrip(b"\x00").decode('utf-8', errors='replace')
 
 # -------------------- Data classes --------------------
 
-@dataclass
-class InstrumentRow:
-    note: int          # 0..72; 90 means unused
-    jump: int          # 0 if empty
-    effect_code: int
-    effect_param: int
+# Row blocks are stored column-wise: one compact array per field, indexed by row.
+
+@dataclass(slots=True)
+class Subpattern:
+    notes: array       # u32; 0..72, 90 means unused
+    jumps: array       # u32; 0 if empty
+    effects: array     # u32 effect codes
+    params: array      # u8 effect params
+
+# One class per instrument kind, holding only the fields that kind uses.
+# subpattern_enabled is None before v6; rows is None when a v6 subpattern is disabled.
 
-@dataclass
-class Instrument:
-    type: int          # 0 = Duty, 1 = Wave, 2 = Noise
+@dataclass(slots=True)
+class DutyInstrument:
+    type: ClassVar[int] = 0
     name: str
     length: int
     length_enabled: bool
-    # Duty specifics
-    initial_volume: Optional[int] = None
-    volume_sweep_dir: Optional[int] = None    # 0 inc, 1 dec
-    volume_sweep_change: Optional[int] = None
-    freq_sweep_time: Optional[int] = None
-    sweep_enabled: Optional[int] = None       # 1 enabled, 0 disabled
-    freq_sweep_shift: Optional[int] = None
-    duty_cycle: Optional[int] = None
-    # Wave specifics
-    volume: Optional[int] = None
-    wave_index: Optional[int] = None
-    # Noise specifics
-    noise_mode: Optional[int] = None          # v<6: 0=15-bit, 1=7-bit
-    # Common (v>=6)
-    subpattern_enabled: Optional[bool] = None
-    rows: Optional[List[InstrumentRow]] = None
-
-@dataclass
-class PatternRow:
-    note: int
-    instrument_val: int
-    effect_code: int
-    effect_param: int
-
-@dataclass
+    initial_volume: int
+    volume_sweep_dir: int      # 0 inc, 1 dec
+    volume_sweep_change: int
+    freq_sweep_time: int
+    sweep_enabled: int         # 1 enabled, 0 disabled
+    freq_sweep_shift: int
+    duty_cycle: int
+    subpattern_enabled: Optional[bool]
+    rows: Optional[Subpattern]
+
+@dataclass(slots=True)
+class WaveInstrument:
+    type: ClassVar[int] = 1
+    name: str
+    length: int
+    length_enabled: bool
+    volume: int
+    wave_index: int
+    subpattern_enabled: Optional[bool]
+    rows: Optional[Subpattern]
+
+@dataclass(slots=True)
+class NoiseInstrument:
+    type: ClassVar[int] = 2
+    name: str
+    length: int
+    length_enabled: bool
+    initial_volume: int
+    volume_sweep_dir: int      # 0 inc, 1 dec
+    volume_sweep_change: int
+    noise_mode: Optional[int]  # v<6 only: 0=15-bit, 1=7-bit
+    subpattern_enabled: Optional[bool]
+    rows: Optional[Subpattern]
+
+Instrument = Union[DutyInstrument, WaveInstrument, NoiseInstrument]
+
+@dataclass(slots=True)
 class Pattern:
     index: int
-    rows: List[PatternRow]
+    notes: array       # u32
+    insts: array       # u32 instrument values
+    effects: array     # u32 effect codes
+    params: array      # u8 effect params
 
-@dataclass
+@dataclass(slots=True)
 class Orders:
     duty1: List[int]
     duty2: List[int]
     wave: List[int]
     noise: List[int]
 
-@dataclass
+@dataclass(slots=True)
 class UgeSong:
     version: int
     name: str
     artist: str
     comment: str
-    duty_instruments: List[Instrument]
-    wave_instruments: List[Instrument]
-    noise_instruments: List[Instrument]
+    duty_instruments: List[DutyInstrument]
+    wave_instruments: List[WaveInstrument]
+    noise_instruments: List[NoiseInstrument]
     wavetable_nibbles: List[List[int]]  # 16 waves × 32 nibbles
     initial_tpr: int
     timer_tempo_enabled: Optional[bool]
@@ -130,333 +200,288 @@ class UgeSong:
 
 # -------------------- Parsing functions --------------------
 
-def parse_instrument_rows(f: BinaryIO, version: int, ctx: str) -> List[InstrumentRow]:
-    rows: List[InstrumentRow] = []
-    for r in range(64):
-        note = read_u32(f, f"{ctx}.row[{r}].note")
-        _unused = read_u32(f, f"{ctx}.row[{r}].unused")
-        jump = read_u32(f, f"{ctx}.row[{r}].jump")
-        effect_code = read_u32(f, f"{ctx}.row[{r}].effect_code")
-        effect_param = read_u8(f, f"{ctx}.row[{r}].effect_param")
-        rows.append(InstrumentRow(note=note, jump=jump, effect_code=effect_code, effect_param=effect_param))
+# Row blocks are always 64 fixed-size rows; each block is unpacked in one call
+_INST_ROWS = struct.Struct('<' + 'IIIIB' * 64)    # note, unused, jump, effect_code, effect_param
+# Whole pattern records (index + 64 rows) so the pattern block can be iter_unpack'ed in one pass
+_PAT_ROWS_V5 = struct.Struct('<I' + 'IIIB' * 64)   # index; note, instrument_value, effect_code, effect_param
+_PAT_ROWS_V6 = struct.Struct('<I' + 'IIIIB' * 64)  # index; note, instrument_value, unused_v6, effect_code, effect_param
+
+def parse_instrument_rows(cur: Cursor, version: int, ctx: str) -> Subpattern:
+    t = _INST_ROWS.unpack(read_exact(cur, _INST_ROWS.size, f"{ctx}.rows[64]"))
+    # Columns: note, jump, effect_code, effect_param (skipping the unused u32)
+    rows = Subpattern(notes=array('I', t[0::5]), jumps=array('I', t[2::5]),
+                      effects=array('I', t[3::5]), params=array('B', t[4::5]))
     if 4 <= version < 6:
-        for i in range(6):
-            _ = read_i8(f, f"{ctx}.post_rows_unused[{i}]")
+        skip(cur, 6, f"{ctx}.post_rows_unused[6]")
     return rows
 
-# Duty instrument per spec
+# Instrument type word, with a small resync if a stray byte shifted it
 
-def parse_duty_instrument(f: BinaryIO, version: int, idx: int) -> Instrument:
-    base_off = f.tell()
-    # Peek a few bytes for diagnostics so we can print helpful hex context
-    peek = read_exact(f, 8, f"duty[{idx}].peek")
-    # rewind to original position so regular readers advance as before
-    f.seek(base_off)
-    inst_type = read_u32(f, f"duty[{idx}].type")
-    if inst_type != 0:
+def read_inst_type(cur: Cursor, expected: int, kind: str, idx: int) -> int:
+    base_off = cur.off
+    inst_type = read_u32(cur, f"{kind}[{idx}].type")
+    if inst_type != expected:
         # Attempt small resync: sometimes a single stray byte shifts fields.
-        found = False
-        for shift in range(1,5):
-            try:
-                f.seek(base_off + shift)
-                cand = read_u32(f, f"duty[{idx}].type.peek_shift{shift}")
-            except EOFError:
-                break
-            if cand == 0:
-                print(f"WARNING: resyncing duty[{idx}] by {shift} byte(s) (was {inst_type}) at offset {base_off} -> {base_off+shift}")
-                # Seek to the corrected start and continue parsing from there
-                f.seek(base_off + shift)
-                inst_type = cand
-                found = True
-                break
-        if not found:
-            # Show the 8-byte context we peeked (hex) to help debug misalignment
-            hex_ctx = ' '.join(f"{b:02X}" for b in peek)
-            raise ValueError(f"Unexpected duty instrument type {inst_type} at offset {base_off}; expected 0. Bytes@{base_off}: {hex_ctx}")
-
-    name = read_shortstring(f, f"duty[{idx}].name")
-    length = read_u32(f, f"duty[{idx}].length")
-    length_enabled = read_bool_u8(f, f"duty[{idx}].length_enabled")
-
-    initial_volume = read_u8(f, f"duty[{idx}].initial_volume")
-    volume_sweep_dir = read_u32(f, f"duty[{idx}].volume_sweep_dir")
-    volume_sweep_change = read_u8(f, f"duty[{idx}].volume_sweep_change")
-    freq_sweep_time = read_u32(f, f"duty[{idx}].freq_sweep_time")
-    sweep_enabled = read_u32(f, f"duty[{idx}].sweep_enabled")
-    freq_sweep_shift = read_u32(f, f"duty[{idx}].freq_sweep_shift")
-    duty_cycle = read_u8(f, f"duty[{idx}].duty_cycle")
-
-    print(f"INST {idx}: {name} | sweep_time={freq_sweep_time} | sweep_dir={sweep_enabled} | sweep_shift={freq_sweep_shift}")
-
-    # Two unused u32s
-    _ = read_u32(f, f"duty[{idx}].unused_a")
-    _ = read_u32(f, f"duty[{idx}].unused_b")
+        # Look for the expected type word starting 1-4 bytes further on.
+        hit = cur.buf.obj.find(_U32.pack(expected), base_off + 1, base_off + 8)
+        if hit == -1:
+            # Show 8 bytes (hex) from the instrument start to help debug misalignment
+            hex_ctx = ' '.join(f"{b:02X}" for b in cur.buf[base_off:base_off + 8])
+            raise ValueError(f"Unexpected {kind} instrument type {inst_type} at offset {base_off}; expected {expected}. Bytes@{base_off}: {hex_ctx}")
+        print(f"WARNING: resyncing {kind}[{idx}] by {hit - base_off} byte(s) (was {inst_type}) at offset {base_off} -> {hit}")
+        # Continue parsing right after the corrected type word
+        cur.off = hit + 4
+        inst_type = expected
+    return inst_type
+
+# Instrument body after the type word, one Struct per kind and version.
+# Every kind starts with name (u8 length + 255 bytes), length u32, length_enabled u8;
+# v<6 always follows with the 64-row block, v6 ends with subpattern_enabled u8
+# (the 64-row block follows only if enabled). Unused field runs are skipped as
+# pad bytes so they are never decoded:
+_DUTY_UNUSED = '8x'     # unused_a, unused_b: u32 x2
+_WAVE_UNUSED = '19x'    # unused1..7: u8, u32, u8, u32, u32, u32, u8
+_NOISE_UNUSED = '21x'   # unused_a..f: u32, u32, u32, u8, u32, u32
+_VLT6_UNUSED = '12x'    # v<6 duty/wave trailer: u32 x3
+_INST_HEAD = '<B255xIB'  # name payload is a pad: decoded in place from the header view
+
+# initial_volume u8, volume_sweep_dir u32, volume_sweep_change u8, freq_sweep_time u32,
+# sweep_enabled u32, freq_sweep_shift u32, duty_cycle u8
+_DUTY_HDR_V5 = struct.Struct(_INST_HEAD + 'BIBIIIB' + _DUTY_UNUSED + _VLT6_UNUSED)
+_DUTY_HDR_V6 = struct.Struct(_INST_HEAD + 'BIBIIIB' + _DUTY_UNUSED + 'B')
+# volume u32, wave_index u32
+_WAVE_HDR_V5 = struct.Struct(_INST_HEAD + _WAVE_UNUSED + 'II' + _VLT6_UNUSED)
+_WAVE_HDR_V6 = struct.Struct(_INST_HEAD + _WAVE_UNUSED + 'II' + 'B')
+# initial_volume u8, volume_sweep_dir u32, volume_sweep_change u8;
+# v<6 trailer: unused u32, noise_mode u32, unused u32
+_NOISE_HDR_V5 = struct.Struct(_INST_HEAD + 'BIB' + _NOISE_UNUSED + '4xI4x')
+_NOISE_HDR_V6 = struct.Struct(_INST_HEAD + 'BIB' + _NOISE_UNUSED + 'B')
+
+# Duty instrument per spec
+
+def parse_duty_instrument(cur: Cursor, version: int, idx: int) -> DutyInstrument:
+    read_inst_type(cur, 0, "duty", idx)
+
+    hdr = _DUTY_HDR_V6 if version >= 6 else _DUTY_HDR_V5
+    (name_len, length, length_enabled,
+     initial_volume, volume_sweep_dir, volume_sweep_change, freq_sweep_time,
+     sweep_enabled, freq_sweep_shift, duty_cycle, *tail) = hdr.unpack(raw := read_exact(cur, hdr.size, f"duty[{idx}].header"))
+    name = decode_shortstring(name_len, raw[1:])
+    length_enabled = length_enabled != 0
+
+    if VERBOSE:
+        print(f"INST {idx}: {name} | sweep_time={freq_sweep_time} | sweep_dir={sweep_enabled} | sweep_shift={freq_sweep_shift}")
+
     if version < 6:
-        _ = read_u32(f, f"duty[{idx}].unused_vlt6_c")
-        _ = read_u32(f, f"duty[{idx}].unused_vlt6_d")
-        _ = read_u32(f, f"duty[{idx}].unused_vlt6_e")
         subpattern_enabled = None  # older versions do not use subpattern_enabled
         # older versions include the rows block
-        rows = parse_instrument_rows(f, version, ctx=f"duty[{idx}]")
+        rows = parse_instrument_rows(cur, version, ctx=f"duty[{idx}]")
     else:
-        subpattern_enabled = read_bool_u8(f, f"duty[{idx}].subpattern_enabled")
+        subpattern_enabled = tail[0] != 0
         # In v6, subpattern rows are present only if subpattern_enabled is true.
         if subpattern_enabled:
-            rows = parse_instrument_rows(f, version, ctx=f"duty[{idx}]")
+            rows = parse_instrument_rows(cur, version, ctx=f"duty[{idx}]")
         else:
             rows = None
 
-    return Instrument(
-        type=inst_type, name=name, length=length, length_enabled=length_enabled,
-        initial_volume=initial_volume, volume_sweep_dir=volume_sweep_dir,
-        volume_sweep_change=volume_sweep_change, freq_sweep_time=freq_sweep_time,
-        sweep_enabled=sweep_enabled, freq_sweep_shift=freq_sweep_shift,
-        duty_cycle=duty_cycle, subpattern_enabled=subpattern_enabled, rows=rows
-    )
+    return DutyInstrument(name, length, length_enabled,
+                          initial_volume, volume_sweep_dir, volume_sweep_change, freq_sweep_time,
+                          sweep_enabled, freq_sweep_shift, duty_cycle, subpattern_enabled, rows)
 
 # Wave instrument per spec
 
-def parse_wave_instrument(f: BinaryIO, version: int, idx: int) -> Instrument:
-    base_off = f.tell()
-    # Peek for diagnostics and possible small resync
-    peek = read_exact(f, 8, f"wave[{idx}].peek")
-    f.seek(base_off)
-    inst_type = read_u32(f, f"wave[{idx}].type")
-    if inst_type != 1:
-        found = False
-        for shift in range(1,5):
-            try:
-                f.seek(base_off + shift)
-                cand = read_u32(f, f"wave[{idx}].type.peek_shift{shift}")
-            except EOFError:
-                break
-            if cand == 1:
-                print(f"WARNING: resyncing wave[{idx}] by {shift} byte(s) (was {inst_type}) at offset {base_off} -> {base_off+shift}")
-                f.seek(base_off + shift)
-                inst_type = cand
-                found = True
-                break
-        if not found:
-            hex_ctx = ' '.join(f"{b:02X}" for b in peek)
-            raise ValueError(f"Unexpected wave instrument type {inst_type} at offset {base_off}; expected 1. Bytes@{base_off}: {hex_ctx}")
-
-    name = read_shortstring(f, f"wave[{idx}].name")
-    length = read_u32(f, f"wave[{idx}].length")
-    length_enabled = read_bool_u8(f, f"wave[{idx}].length_enabled")
-
-    _ = read_u8(f,  f"wave[{idx}].unused1_u8")
-    _ = read_u32(f, f"wave[{idx}].unused2_u32")
-    _ = read_u8(f,  f"wave[{idx}].unused3_u8")
-    _ = read_u32(f, f"wave[{idx}].unused4_u32")
-    _ = read_u32(f, f"wave[{idx}].unused5_u32")
-    _ = read_u32(f, f"wave[{idx}].unused6_u32")
-    _ = read_u8(f,  f"wave[{idx}].unused7_u8")
-
-    volume = read_u32(f, f"wave[{idx}].volume")
-    wave_index = read_u32(f, f"wave[{idx}].wave_index")
+def parse_wave_instrument(cur: Cursor, version: int, idx: int) -> WaveInstrument:
+    read_inst_type(cur, 1, "wave", idx)
+
+    hdr = _WAVE_HDR_V6 if version >= 6 else _WAVE_HDR_V5
+    (name_len, length, length_enabled,
+     volume, wave_index, *tail) = hdr.unpack(raw := read_exact(cur, hdr.size, f"wave[{idx}].header"))
+    name = decode_shortstring(name_len, raw[1:])
+    length_enabled = length_enabled != 0
 
     if version < 6:
-        _ = read_u32(f, f"wave[{idx}].unused_vlt6_a")
-        _ = read_u32(f, f"wave[{idx}].unused_vlt6_b")
-        _ = read_u32(f, f"wave[{idx}].unused_vlt6_c")
         subpattern_enabled = None  # older versions do not use subpattern_enabled
         # older versions include the rows block
-        rows = parse_instrument_rows(f, version, ctx=f"wave[{idx}]")
+        rows = parse_instrument_rows(cur, version, ctx=f"wave[{idx}]")
     else:
-        subpattern_enabled = read_bool_u8(f, f"wave[{idx}].subpattern_enabled")
+        subpattern_enabled = tail[0] != 0
         if subpattern_enabled:
-            rows = parse_instrument_rows(f, version, ctx=f"wave[{idx}]")
+            rows = parse_instrument_rows(cur, version, ctx=f"wave[{idx}]")
         else:
             rows = None
 
-    return Instrument(
-        type=inst_type, name=name, length=length, length_enabled=length_enabled,
-        volume=volume, wave_index=wave_index, subpattern_enabled=subpattern_enabled,
-        rows=rows
-    )
+    return WaveInstrument(name, length, length_enabled, volume, wave_index, subpattern_enabled, rows)
 
 # Noise instrument per spec
 
-def parse_noise_instrument(f: BinaryIO, version: int, idx: int) -> Instrument:
-    base_off = f.tell()
-    # Peek for diagnostics and possible small resync
-    peek = read_exact(f, 8, f"noise[{idx}].peek")
-    f.seek(base_off)
-    inst_type = read_u32(f, f"noise[{idx}].type")
-    if inst_type != 2:
-        found = False
-        for shift in range(1,5):
-            try:
-                f.seek(base_off + shift)
-                cand = read_u32(f, f"noise[{idx}].type.peek_shift{shift}")
-            except EOFError:
-                break
-            if cand == 2:
-                print(f"WARNING: resyncing noise[{idx}] by {shift} byte(s) (was {inst_type}) at offset {base_off} -> {base_off+shift}")
-                f.seek(base_off + shift)
-                inst_type = cand
-                found = True
-                break
-        if not found:
-            hex_ctx = ' '.join(f"{b:02X}" for b in peek)
-            raise ValueError(f"Unexpected noise instrument type {inst_type} at offset {base_off}; expected 2. Bytes@{base_off}: {hex_ctx}")
-
-    name = read_shortstring(f, f"noise[{idx}].name")
-    length = read_u32(f, f"noise[{idx}].length")
-    length_enabled = read_bool_u8(f, f"noise[{idx}].length_enabled")
-
-    initial_volume = read_u8(f, f"noise[{idx}].initial_volume")
-    volume_sweep_dir = read_u32(f, f"noise[{idx}].volume_sweep_dir")
-    volume_sweep_change = read_u8(f, f"noise[{idx}].volume_sweep_change")
-
-    _ = read_u32(f, f"noise[{idx}].unused_a")
-    _ = read_u32(f, f"noise[{idx}].unused_b")
-    _ = read_u32(f, f"noise[{idx}].unused_c")
-    _ = read_u8(f,  f"noise[{idx}].unused_d")
-    _ = read_u32(f, f"noise[{idx}].unused_e")
-    _ = read_u32(f, f"noise[{idx}].unused_f")
+def parse_noise_instrument(cur: Cursor, version: int, idx: int) -> NoiseInstrument:
+    read_inst_type(cur, 2, "noise", idx)
+
+    hdr = _NOISE_HDR_V6 if version >= 6 else _NOISE_HDR_V5
+    (name_len, length, length_enabled,
+     initial_volume, volume_sweep_dir, volume_sweep_change,
+     *tail) = hdr.unpack(raw := read_exact(cur, hdr.size, f"noise[{idx}].header"))
+    name = decode_shortstring(name_len, raw[1:])
+    length_enabled = length_enabled != 0
 
     if version < 6:
-        _ = read_u32(f, f"noise[{idx}].unused_vlt6_a")
-        noise_mode = read_u32(f, f"noise[{idx}].noise_mode")  # 0=15-bit, 1=7-bit
-        _ = read_u32(f, f"noise[{idx}].unused_vlt6_b")
+        noise_mode = tail[0]  # 0=15-bit, 1=7-bit
         subpattern_enabled = None
         # older versions include the rows block
-        rows = parse_instrument_rows(f, version, ctx=f"noise[{idx}]")
+        rows = parse_instrument_rows(cur, version, ctx=f"noise[{idx}]")
     else:
         noise_mode = None
-        subpattern_enabled = read_bool_u8(f, f"noise[{idx}].subpattern_enabled")
+        subpattern_enabled = tail[0] != 0
         if subpattern_enabled:
-            rows = parse_instrument_rows(f, version, ctx=f"noise[{idx}]")
+            rows = parse_instrument_rows(cur, version, ctx=f"noise[{idx}]")
         else:
             rows = None
 
-    return Instrument(
-        type=inst_type, name=name, length=length, length_enabled=length_enabled,
-        initial_volume=initial_volume, volume_sweep_dir=volume_sweep_dir,
-        volume_sweep_change=volume_sweep_change, noise_mode=noise_mode,
-        subpattern_enabled=subpattern_enabled, rows=rows
-    )
+    return NoiseInstrument(name, length, length_enabled,
+                           initial_volume, volume_sweep_dir, volume_sweep_change,
+                           noise_mode, subpattern_enabled, rows)
 
 # Wavetable: 16 waves × 32 nibbles (stored as bytes per spec)
 
-def parse_wavetables(f: BinaryIO, version: int) -> List[List[int]]:
-    waves: List[List[int]] = []
-    for w in range(16):
-        nibbles: List[int] = []
-        for i in range(32):
-            nibbles.append(read_u8(f, f"wavetable[{w}].nibble[{i}]"))
-        waves.append(nibbles)
+def parse_wavetables(cur: Cursor, version: int) -> List[List[int]]:
+    raw = read_exact(cur, 16 * 32, "wavetable[16][32]")
+    waves = [list(raw[w * 32:(w + 1) * 32]) for w in range(16)]
     if version < 3:
-        _ = read_u8(f, "wavetable.off_by_one_filler")
+        _ = read_u8(cur, "wavetable.off_by_one_filler")
     return waves
 
 # Patterns per spec
 
-def parse_patterns(f: BinaryIO, version: int) -> Tuple[int, Optional[bool], Optional[int], List[Pattern]]:
-    initial_tpr = read_u32(f, "song.initial_ticks_per_row")
+def parse_patterns(cur: Cursor, version: int) -> Tuple[int, Optional[bool], Optional[int], List[Pattern]]:
+    initial_tpr = read_u32(cur, "song.initial_ticks_per_row")
     timer_enabled = None
     timer_div = None
     if version >= 6:
-        timer_enabled = read_bool_u8(f, "song.timer_tempo_enabled")
-        timer_div = read_u32(f, "song.timer_tempo_divider")
-    num_patterns = read_u32(f, "song.num_patterns")
-    patterns: List[Pattern] = []
-    for p in range(num_patterns):
-        pat_idx = read_u32(f, f"pattern[{p}].index")
-        rows: List[PatternRow] = []
-        for r in range(64):
-            note = read_u32(f, f"pattern[{p}].row[{r}].note")
-            inst_val = read_u32(f, f"pattern[{p}].row[{r}].instrument_value")
-            if version >= 6:
-                _ = read_u32(f, f"pattern[{p}].row[{r}].unused_v6")
-            effect_code = read_u32(f, f"pattern[{p}].row[{r}].effect_code")
-            effect_param = read_u8(f, f"pattern[{p}].row[{r}].effect_param")
-            rows.append(PatternRow(note=note, instrument_val=inst_val,
-                                   effect_code=effect_code, effect_param=effect_param))
-        patterns.append(Pattern(index=pat_idx, rows=rows))
+        timer_enabled = read_bool_u8(cur, "song.timer_tempo_enabled")
+        timer_div = read_u32(cur, "song.timer_tempo_divider")
+    num_patterns = read_u32(cur, "song.num_patterns")
+    record = _PAT_ROWS_V6 if version >= 6 else _PAT_ROWS_V5
+    step = 5 if version >= 6 else 4
+    eff = step - 1  # v6 rows carry an unused u32 before effect_code; +1 for the leading index
+    raw = read_exact(cur, record.size * num_patterns, f"patterns[{num_patterns}].records")
+    patterns: List[Pattern] = [Pattern(index=t[0],
+                                       notes=array('I', t[1::step]), insts=array('I', t[2::step]),
+                                       effects=array('I', t[eff::step]), params=array('B', t[eff + 1::step]))
+                               for t in record.iter_unpack(raw)]
 
     return initial_tpr, timer_enabled, timer_div, patterns
 
 # Orders per spec
 
-def parse_orders(f: BinaryIO) -> Orders:
+def parse_orders(cur: Cursor) -> Orders:
     channels = []
     chan_names = ["Duty1", "Duty2", "Wave", "Noise"]
     for c in range(4):
-        order_len_plus_one = read_u32(f, f"orders[{chan_names[c]}].length_plus_one")
+        order_len_plus_one = read_u32(cur, f"orders[{chan_names[c]}].length_plus_one")
         order_len = max(0, order_len_plus_one - 1)
         indices: List[int] = []
         for i in range(order_len):
-            idx = read_u32(f, f"orders[{chan_names[c]}].index[{i}]")
-            filler = read_u32(f, f"orders[{chan_names[c]}].filler[{i}]")
+            idx = read_u32(cur, f"orders[{chan_names[c]}].index[{i}]")
+            filler = read_u32(cur, f"orders[{chan_names[c]}].filler[{i}]")
             indices.append(idx)
         channels.append(indices)
     return Orders(duty1=channels[0], duty2=channels[1], wave=channels[2], noise=channels[3])
 
 # Routines per spec: 16 strings
 
-def parse_routines(f: BinaryIO) -> List[str]:
+def parse_routines(cur: Cursor) -> List[str]:
     routines: List[str] = []
     for i in range(16):
-        code = read_string(f, f"routine[{i}]")
+        code = read_string(cur, f"routine[{i}]")
         routines.append(code)
     return routines
 
 # Full file parse
 
 def read_uge(path: str) -> UgeSong:
+    """Parse a .uge file into a UgeSong. This is the library entry point; it prints nothing
+    unless VERBOSE is set (or an instrument needed resyncing)."""
+    # Files are at most a few hundred KB: read once, then parse from memory
     with open(path, 'rb') as f:
-        version = read_u32(f, "header.version")
-        # Validate supported versions early to avoid confusing parse errors.
-        # This parser targets hUGETracker UGE v5/v6; older files (v4 or earlier)
-        # use an incompatible layout and will lead to misaligned reads.
-        if version < 5 or version > 6:
-            raise ValueError(f"Unsupported UGE version {version}. This parser supports only v5 or v6 files.")
-        name = read_shortstring(f, "header.song_name")
-        artist = read_shortstring(f, "header.song_artist")
-        comment = read_shortstring(f, "header.song_comment")
-
-        # Diagnostic: print file offset before instrument blocks
-        print(f"DEBUG: after header, file offset={f.tell()}")
-
-        duty_insts = []
-        for i in range(15):
-            print(f"DEBUG: parsing duty[{i}] at offset={f.tell()}")
-            duty_insts.append(parse_duty_instrument(f, version, idx=i))
-
-        wave_insts = []
-        for i in range(15):
-            print(f"DEBUG: parsing wave[{i}] at offset={f.tell()}")
-            wave_insts.append(parse_wave_instrument(f, version, idx=i))
-
-        noise_insts = []
-        for i in range(15):
-            print(f"DEBUG: parsing noise[{i}] at offset={f.tell()}")
-            noise_insts.append(parse_noise_instrument(f, version, idx=i))
-
-        waves = parse_wavetables(f, version)
-        initial_tpr, timer_enabled, timer_div, patterns = parse_patterns(f, version)
-        orders = parse_orders(f)
-        routines = parse_routines(f)
-
-        return UgeSong(
-            version=version, name=name, artist=artist, comment=comment,
-            duty_instruments=duty_insts, wave_instruments=wave_insts,
-            noise_instruments=noise_insts, wavetable_nibbles=waves,
-            initial_tpr=initial_tpr, timer_tempo_enabled=timer_enabled,
-            timer_tempo_divider=timer_div, patterns=patterns,
-            orders=orders, routines=routines
-        )
+        cur = Cursor(f.read())
+
+    version = read_u32(cur, "header.version")
+    # Validate supported versions early to avoid confusing parse errors.
+    # This parser targets hUGETracker UGE v5/v6; older files (v4 or earlier)
+    # use an incompatible layout and will lead to misaligned reads.
+    if version < 5 or version > 6:
+        raise ValueError(f"Unsupported UGE version {version}. This parser supports only v5 or v6 files.")
+    name = read_shortstring(cur, "header.song_name")
+    artist = read_shortstring(cur, "header.song_artist")
+    comment = read_shortstring(cur, "header.song_comment")
+
+    # Diagnostic: print file offset before instrument blocks
+    if VERBOSE:
+        print(f"DEBUG: after header, file offset={cur.off}")
+
+    duty_insts = []
+    for i in range(15):
+        if VERBOSE:
+            print(f"DEBUG: parsing duty[{i}] at offset={cur.off}")
+        duty_insts.append(parse_duty_instrument(cur, version, idx=i))
+
+    wave_insts = []
+    for i in range(15):
+        if VERBOSE:
+            print(f"DEBUG: parsing wave[{i}] at offset={cur.off}")
+        wave_insts.append(parse_wave_instrument(cur, version, idx=i))
+
+    noise_insts = []
+    for i in range(15):
+        if VERBOSE:
+            print(f"DEBUG: parsing noise[{i}] at offset={cur.off}")
+        noise_insts.append(parse_noise_instrument(cur, version, idx=i))
+
+    waves = parse_wavetables(cur, version)
+    initial_tpr, timer_enabled, timer_div, patterns = parse_patterns(cur, version)
+    orders = parse_orders(cur)
+    routines = parse_routines(cur)
+
+    return UgeSong(
+        version=version, name=name, artist=artist, comment=comment,
+        duty_instruments=duty_insts, wave_instruments=wave_insts,
+        noise_instruments=noise_insts, wavetable_nibbles=waves,
+        initial_tpr=initial_tpr, timer_tempo_enabled=timer_enabled,
+        timer_tempo_divider=timer_div, patterns=patterns,
+        orders=orders, routines=routines
+    )
 
 # -------------------- Pretty printer --------------------
 
+# Row value formatters, memoized per unique (note, x, effect, param) tuple: most rows
+# are empty or repeat, so each distinct string is built once and reused
+_INST_ROW = functools.cache("note={}, jump={}, effect={}, param={}".format)
+_PAT_ROW = functools.cache("note={}, inst={}, effect={}, param={}".format)
+
+@functools.cache
+def _row_prefixes(indent: int, n: int) -> Tuple[str, ...]:
+    return tuple(f"{'  ' * indent}{r:02d}: " for r in range(n))
+
 class Printer:
+    """Collects indented lines; flush() writes them all to stdout at once."""
+
     def __init__(self):
         self.indent = 0
+        self.lines: List[str] = []
 
     def p(self, msg: str):
-        print("  " * self.indent + msg)
+        self.lines.append("  " * self.indent + msg)
+
+    def rows(self, fmt: Callable[..., str], *cols):
+        """Add a whole block of row lines as one entry, one line per column index."""
+        if not cols[0]:
+            return
+        prefixes = _row_prefixes(self.indent, len(cols[0]))
+        self.lines.append('\n'.join(map(operator.add, prefixes, map(fmt, *cols))))
+
+    def flush(self):
+        sys.stdout.write('\n'.join(self.lines) + '\n')
+        self.lines.clear()
 
     def section(self, title: str):
         self.p(title)
@@ -469,6 +494,7 @@ class Printer:
 
 
 def dump_song(song: UgeSong):
+    """Print every field of a parsed song to stdout (CLI output)."""
     pr = Printer()
 
     pr.section(f"UGE version: {song.version}")
@@ -488,8 +514,9 @@ def dump_song(song: UgeSong):
         pr.p(f"subpattern_enabled={inst.subpattern_enabled}")
         pr.section("rows:")
         pr.push()
-        for r, row in enumerate(inst.rows or []):
-            pr.p(f"{r:02d}: note={row.note}, jump={row.jump}, effect={row.effect_code}, param={row.effect_param}")
+        sub = inst.rows
+        if sub is not None:
+            pr.rows(_INST_ROW, sub.notes, sub.jumps, sub.effects, sub.params)
         pr.pop()
         pr.pop()
     pr.pop()
@@ -502,8 +529,9 @@ def dump_song(song: UgeSong):
         pr.p(f"volume={inst.volume}, wave_index={inst.wave_index}, subpattern_enabled={inst.subpattern_enabled}")
         pr.section("rows:")
         pr.push()
-        for r, row in enumerate(inst.rows or []):
-            pr.p(f"{r:02d}: note={row.note}, jump={row.jump}, effect={row.effect_code}, param={row.effect_param}")
+        sub = inst.rows
+        if sub is not None:
+            pr.rows(_INST_ROW, sub.notes, sub.jumps, sub.effects, sub.params)
         pr.pop()
         pr.pop()
     pr.pop()
@@ -518,8 +546,9 @@ def dump_song(song: UgeSong):
              f"subpattern_enabled={inst.subpattern_enabled}")
         pr.section("rows:")
         pr.push()
-        for r, row in enumerate(inst.rows or []):
-            pr.p(f"{r:02d}: note={row.note}, jump={row.jump}, effect={row.effect_code}, param={row.effect_param}")
+        sub = inst.rows
+        if sub is not None:
+            pr.rows(_INST_ROW, sub.notes, sub.jumps, sub.effects, sub.params)
         pr.pop()
         pr.pop()
     pr.pop()
@@ -539,8 +568,7 @@ def dump_song(song: UgeSong):
     for p, pat in enumerate(song.patterns):
         pr.section(f"Pattern[{p}] index={pat.index}")
         pr.push()
-        for r, row in enumerate(pat.rows):
-            pr.p(f"{r:02d}: note={row.note}, inst={row.instrument_val}, effect={row.effect_code}, param={row.effect_param}")
+        pr.rows(_PAT_ROW, pat.notes, pat.insts, pat.effects, pat.params)
         pr.pop()
     pr.pop()
 
@@ -559,14 +587,23 @@ def dump_song(song: UgeSong):
         pr.p(f"[{i:02d}] {preview}")
     pr.pop()
 
+    pr.flush()
+
 # -------------------- CLI --------------------
 
 def main(argv: List[str]):
-    if len(argv) < 2:
-        print("Usage: python uge_parser_verbose.py path/to/song.uge")
-        sys.exit(1)
-    path = argv[1]
-    song = read_uge(path)
+    global VERBOSE
+    parser = argparse.ArgumentParser(description="Read a hUGETracker .uge file (v5/v6) and print all details.")
+    parser.add_argument("path", help="path/to/song.uge")
+    parser.add_argument("-v", "--verbose", action="store_true",
+                        help="also print per-instrument parse diagnostics (offsets, sweep fields)")
+    parser.add_argument("-q", "--quiet", action="store_true",
+                        help="parse and validate only; skip the full dump")
+    args = parser.parse_args(argv[1:])
+    VERBOSE = args.verbose
+    song = read_uge(args.path)
+    if args.quiet:
+        return
     dump_song(song)
 
 if __name__ == '__main__':